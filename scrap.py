@@ -1,25 +1,34 @@
 import time
 import csv
+import json
 import os
 from datetime import datetime
 import re
-from collections import Counter
+import importlib.util
+from functools import lru_cache
+from itertools import chain
+from multiprocessing import Pool
 
-from bs4 import BeautifulSoup as bs
+import numpy as np
+import pandas as pd
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-# For sentiment analysis
-try:
-    from textblob import TextBlob
-    SENTIMENT_AVAILABLE = True
-except ImportError:
+# Large buffer for reading and writing the CSVs; the scraper still flushes every CSV_BATCH_SIZE rows
+_CSV_BUFFER_SIZE = 1 << 20
+
+# For sentiment analysis (TextBlob itself is only imported on first use)
+SENTIMENT_AVAILABLE = importlib.util.find_spec("textblob") is not None
+if not SENTIMENT_AVAILABLE:
     print("[!] TextBlob not installed. Install with: pip install textblob")
     print("[!] Sentiment analysis will be skipped.")
-    SENTIMENT_AVAILABLE = False
+
+# TextBlob's default sentiment is this lexicon scorer; calling it directly skips
+# building a TextBlob and a PatternAnalyzer result namedtuple for every post
+_pattern_sentiment = None
 
 # ---------------------------------------------------------------------------------------
 # Function to load existing post IDs from CSV file
@@ -29,12 +38,18 @@ def load_existing_post_ids(csv_file):
     existing_ids = set()
     if os.path.exists(csv_file):
         try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    post_id = row.get('Post_ID', '').strip()
-                    if post_id:
-                        existing_ids.add(post_id)
+            with open(csv_file, 'r', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+                # A plain reader avoids building a dict per row just to read one column
+                reader = csv.reader(file)
+                header = next(reader, [])
+                if 'Post_ID' in header:
+                    id_index = header.index('Post_ID')
+                    # IDs are numeric activity URNs written without padding; ints make smaller
+                    # set entries and hash cheaper
+                    existing_ids = {
+                        int(row[id_index]) for row in reader
+                        if len(row) > id_index and row[id_index].isdigit()
+                    }
             print(f"[*] Loaded {len(existing_ids)} existing post IDs from {csv_file}")
         except Exception as e:
             print(f"[!] Error loading existing post IDs: {e}")
@@ -43,37 +58,26 @@ def load_existing_post_ids(csv_file):
     return existing_ids
 
 # ---------------------------------------------------------------------------------------
-# Function to initialize CSV file with headers if it doesn't exist
+# Function to initialize CSV file with headers if it is empty
 # ---------------------------------------------------------------------------------------
-def initialize_csv_file(csv_file):
-    """Initialize CSV file with headers if it doesn't exist"""
-    if not os.path.exists(csv_file):
+def initialize_csv_file(csv_file, csv_handle, writer):
+    """Write the CSV headers if the file just opened for appending is empty"""
+    if csv_handle.tell() == 0:
         print(f"[*] Creating new CSV file: {csv_file}")
-        with open(csv_file, mode='w', encoding='utf-8', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            writer.writerow([
-                "Post_ID",
-                "Post_Author_Name",
-                "Post_Author_Profile",
-                "Post_Author_JobTitle",
-                "Post_Content",
-                "Post_Reactions",
-                "Sentiment",
-                "Sentiment_Score",
-                "Date_Collected"
-            ])
+        writer.writerow([
+            "Post_ID",
+            "Post_Author_Name",
+            "Post_Author_Profile",
+            "Post_Author_JobTitle",
+            "Post_Content",
+            "Post_Reactions",
+            "Sentiment",
+            "Sentiment_Score",
+            "Date_Collected"
+        ])
     else:
         print(f"[*] Using existing CSV file: {csv_file}")
 
-# ---------------------------------------------------------------------------------------
-# Function to append new post data to CSV file
-# ---------------------------------------------------------------------------------------
-def append_post_to_csv(csv_file, post_data):
-    """Append a single post to the CSV file"""
-    with open(csv_file, mode='a', encoding='utf-8', newline='') as file:
-        writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-        writer.writerow(post_data)
-
 # ---------------------------------------------------------------------------------------
 # Function to load cookies from a Netscape-format cookies.txt file into Selenium's browser
 # ---------------------------------------------------------------------------------------
@@ -103,41 +107,194 @@ def load_cookies(browser, file_path):
 # ---------------------------------------------------------------------------------------
 # Helper function to convert abbreviated reaction/comment strings (e.g., "1K") to integers
 # ---------------------------------------------------------------------------------------
+_ABBREVIATION_MULTIPLIERS = {'K': 1000, 'M': 1000000}
+
 def convert_abbreviated_to_number(s):
     s = s.upper().strip()
-    if 'K' in s:
-        return int(float(s.replace('K', '')) * 1000)
-    elif 'M' in s:
-        return int(float(s.replace('M', '')) * 1000000)
-    else:
-        try:
-            return int(s)
-        except ValueError:
-            return 0
+    multiplier = _ABBREVIATION_MULTIPLIERS.get(s[-1:])
+    if multiplier is not None:
+        return int(float(s[:-1]) * multiplier)
+    try:
+        return int(s)
+    except ValueError:
+        return 0
 
 # ---------------------------------------------------------------------------------------
-# Helper function to analyze sentiment of text
+# Helper function to undo LinkedIn's duplicated name/job title text (visible + screen-reader copy)
 # ---------------------------------------------------------------------------------------
-def analyze_sentiment(text):
-    if not SENTIMENT_AVAILABLE or not text:
-        return "neutral", 0.0
+def take_first_half(text):
+    n = len(text)
+    half = n // 2
+    # Exact repeat, either back to back or around a single middle separator
+    if half and text[:half] == text[n - half:] and (n % 2 == 0 or text[half].isspace()):
+        return text[:half].rstrip()
+    words = text.split()
+    if len(words) >= 2:
+        return ' '.join(words[:len(words) // 2])
+    return text
+
+# ---------------------------------------------------------------------------------------
+# Helper function to compute the sentiment polarity of text
+# ---------------------------------------------------------------------------------------
+# Reshared posts repeat the same text, so identical content is only scored once per process
+@lru_cache(maxsize=4096)
+def sentiment_polarity(text):
+    # Blank posts (reshares without commentary) can't match the lexicon; skip the scorer
+    if not text or text.isspace():
+        return 0.0
+    
+    if _pattern_sentiment is None and not load_sentiment_scorer():
+        return 0.0
     
     try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        
-        # Classify sentiment based on polarity
-        if polarity > 0.1:
-            sentiment = "positive"
-        elif polarity < -0.1:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
-            
-        return sentiment, round(polarity, 3)
+        return _pattern_sentiment(text)[0]
     except Exception as e:
         print(f"[!] Error analyzing sentiment: {e}")
-        return "neutral", 0.0
+        return 0.0
+
+def _sentiment_polarity_unavailable(text):
+    """Fallback used when TextBlob is not installed"""
+    return 0.0
+
+# Without TextBlob every post is neutral, so skip the checks above entirely
+if not SENTIMENT_AVAILABLE:
+    sentiment_polarity = _sentiment_polarity_unavailable
+
+def load_sentiment_scorer():
+    """Import the lexicon scorer once; a broken TextBlob install is treated like a missing one"""
+    global _pattern_sentiment, SENTIMENT_AVAILABLE, sentiment_polarity
+    if SENTIMENT_AVAILABLE and _pattern_sentiment is None:
+        try:
+            from textblob.en import sentiment as _pattern_sentiment
+        except ImportError as e:
+            print(f"[!] TextBlob could not be imported: {e}")
+            print("[!] Sentiment analysis will be skipped.")
+            SENTIMENT_AVAILABLE = False
+            sentiment_polarity = _sentiment_polarity_unavailable
+    return SENTIMENT_AVAILABLE
+
+# Batches smaller than this are scored in-process; starting worker processes costs more
+# than it saves on a few hundred short posts
+_PARALLEL_SENTIMENT_MIN_TEXTS = 500
+_SENTIMENT_CHUNK_SIZE = 32
+
+# Polarity below -0.1 is negative and above 0.1 positive, with both thresholds themselves
+# neutral; the upper edge sits one float past 0.1 because digitize bins are half-open
+_SENTIMENT_LABELS = np.array(["negative", "neutral", "positive"])
+_SENTIMENT_BINS = np.array([-0.1, np.nextafter(0.1, np.inf)])
+
+# ---------------------------------------------------------------------------------------
+# Helper function to analyze sentiment of a batch of texts
+# ---------------------------------------------------------------------------------------
+def analyze_sentiments(texts):
+    """Return a (sentiment, score) pair for each text, classifying all polarities at once"""
+    # Import in the parent first so pool workers inherit the scorer (or the fallback)
+    if texts and load_sentiment_scorer() and len(texts) >= _PARALLEL_SENTIMENT_MIN_TEXTS:
+        # Lexicon scoring is CPU-bound pure Python, so spread it across cores
+        with Pool(processes=os.cpu_count()) as pool:
+            scores = pool.map(sentiment_polarity, texts, chunksize=_SENTIMENT_CHUNK_SIZE)
+    else:
+        scores = map(sentiment_polarity, texts)
+    polarities = np.fromiter(scores, dtype=np.float64, count=len(texts))
+    
+    # Classify sentiment based on polarity: one binary search per score picks the label
+    sentiments = _SENTIMENT_LABELS[np.digitize(polarities, _SENTIMENT_BINS)]
+    
+    return [(sentiment, round(polarity, 3)) for sentiment, polarity in zip(sentiments.tolist(), polarities.tolist())]
+
+# ---------------------------------------------------------------------------------------
+# Function to fill in sentiment for rows written without it during scraping
+# ---------------------------------------------------------------------------------------
+def backfill_sentiment(csv_file):
+    """Analyze sentiment for rows with empty sentiment columns, rewrite the CSV and return all rows"""
+    try:
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+            reader = csv.DictReader(file)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+    except Exception as e:
+        print(f"[!] Error reading {csv_file} for sentiment analysis: {e}")
+        return None
+    
+    pending_rows = [row for row in rows if not row.get('Sentiment') or not row.get('Sentiment_Score')]
+    results = analyze_sentiments([row.get('Post_Content', '') for row in pending_rows])
+    for row, (sentiment, score) in zip(pending_rows, results):
+        row['Sentiment'] = sentiment
+        row['Sentiment_Score'] = score
+    updated_count = len(pending_rows)
+    
+    if updated_count:
+        # Write to a temporary file first so an interrupted rewrite never truncates the data
+        tmp_file = f"{csv_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+                writer = csv.DictWriter(file, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+                writer.writeheader()
+                writer.writerows(rows)
+            os.replace(tmp_file, csv_file)
+        except Exception as e:
+            print(f"[!] Error writing sentiment analysis to {csv_file}: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return None
+    
+    print(f"[*] Sentiment analyzed for {updated_count} posts")
+    return rows
+
+# ---------------------------------------------------------------------------------------
+# Precompiled patterns and tables used by clean_post_content
+# ---------------------------------------------------------------------------------------
+_NORMALIZE_TABLE = str.maketrans({
+    '\n': ' ', '\r': ' ',
+    '\u2018': "'", '\u2019': "'",
+    '\u201c': '"', '\u201d': '"',
+    '`': "'", '\u00b4': "'",
+})
+
+# Tildes and bullets are deleted only after the markdown patterns run: removing them
+# first can join or split '*'/'_' runs and change what the patterns match
+_AFTER_MARKDOWN_TABLE = str.maketrans('', '', '~•◦▪▫‣')
+
+# Emoji and symbol stripping is pure single-codepoint deletion, so it is done with
+# str.translate against a deletion table instead of a regex character class
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F1E0, 0x1F1FF),  # flags
+    (0x1F900, 0x1F9FF),  # supplemental symbols & pictographs
+    (0x1FA70, 0x1FAFF),  # symbols & pictographs extended-A
+    (0x2600, 0x26FF),    # miscellaneous symbols
+    (0x2700, 0x27BF),    # dingbats
+    (0x1F780, 0x1F7FF),  # geometric shapes extended
+    (0x1F800, 0x1F8FF),  # supplemental arrows-C
+)
+# Individual codepoints outside the blocks above
+_EMOJI_SYMBOLS = (
+    '\ufe0f'          # emoji presentation selector left behind by e.g. '❤️'
+    '\u2b50'          # white medium star
+    '≈≠≤≥±×÷√∞∆∑∏∫'  # math symbols
+    '†‡§¶'            # typographic marks
+)
+# Control characters other than tab, newline and carriage return
+_CONTROL_CHARS = (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F)
+
+# Every single-codepoint rewrite (line breaks, quotes, emoji, symbols, control characters
+# and backticks) that comes before markdown stripping goes through this one table, so it
+# is a single C-level pass
+_CLEAN_TABLE = {
+    **dict.fromkeys(chain(
+        chain.from_iterable(range(start, end + 1) for start, end in _EMOJI_RANGES),
+        map(ord, _EMOJI_SYMBOLS),
+        _CONTROL_CHARS,
+    )),
+    **_NORMALIZE_TABLE,
+}
+
+_MARKDOWN_BOLD_RE = re.compile(r'\*{1,3}([^*]*)\*{1,3}')
+_MARKDOWN_UNDERLINE_RE = re.compile(r'_{1,3}([^_]*)_{1,3}')
+_HASHTAG_RE = re.compile(r'hashtag\s*#', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
 
 # ---------------------------------------------------------------------------------------
 # Cleaner function to remove unecessary symbols and characters
@@ -147,45 +304,20 @@ def clean_post_content(content):
     if not content:
         return ""
     
-    content = content.replace('\n', ' ').replace('\r', ' ')
-    
-    content = content.replace("'", "'").replace("'", "'")
-    content = content.replace('"', '"').replace('"', '"')
-    content = content.replace('`', "'").replace('´', "'")
-    
-    content = re.sub(r'[\U0001F600-\U0001F64F]', '', content)  
-    content = re.sub(r'[\U0001F300-\U0001F5FF]', '', content)  
-    content = re.sub(r'[\U0001F680-\U0001F6FF]', '', content)  
-    content = re.sub(r'[\U0001F1E0-\U0001F1FF]', '', content)  
-    content = re.sub(r'[\U0001F900-\U0001F9FF]', '', content)  
-    content = re.sub(r'[\U0001FA70-\U0001FAFF]', '', content)  
-    
-    content = re.sub(r'[\U00002600-\U000026FF]', '', content) 
-    content = re.sub(r'[\U00002700-\U000027BF]', '', content)  
-    content = re.sub(r'[\U0001F780-\U0001F7FF]', '', content)  
-    content = re.sub(r'[\U0001F800-\U0001F8FF]', '', content)  
+    content = content.translate(_CLEAN_TABLE)
     
-    content = re.sub(r'[❤️💙💚💛💜🖤🤍🤎❣️💕💞💓💗💖💘💝]', '', content)
-    content = re.sub(r'[✅❌☕🟢🔴🟡🟠🟣🟤⚫⚪]', '', content)
-    content = re.sub(r'[⭐🌟✨💫⚡🔥💯]', '', content)
-    content = re.sub(r'[👍👎👏🙌🤝👋]', '', content)
+    # Most posts have no markdown or hashtags; a substring check is far cheaper than a regex scan
+    if '*' in content:
+        content = _MARKDOWN_BOLD_RE.sub(r'\1', content)
+    if '_' in content:
+        content = _MARKDOWN_UNDERLINE_RE.sub(r'\1', content)
     
-    content = re.sub(r'[≈≠≤≥±×÷√∞∆∑∏∫]', '', content)
+    content = content.translate(_AFTER_MARKDOWN_TABLE)
     
-    content = re.sub(r'[†‡§¶]', '', content)
+    if '#' in content:
+        content = _HASHTAG_RE.sub('#', content)
     
-    content = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content)
-    
-    content = re.sub(r'\*{1,3}([^*]*)\*{1,3}', r'\1', content)  
-    content = re.sub(r'_{1,3}([^_]*)_{1,3}', r'\1', content)   
-    
-    content = re.sub(r'[`~]', '', content)  
-    
-    content = re.sub(r'[•◦▪▫‣]', '', content)
-    
-    content = re.sub(r'hashtag\s*#', '#', content, flags=re.IGNORECASE)
-    
-    content = re.sub(r'\s+', ' ', content)
+    content = _WS_RE.sub(' ', content)
     
     content = content.strip()
     
@@ -194,28 +326,26 @@ def clean_post_content(content):
 # ---------------------------------------------------------------------------------------
 # Function to generate sentiment analysis report
 # ---------------------------------------------------------------------------------------
-def generate_sentiment_report(csv_file, report_file):
+_REPORT_COLUMNS = ['Sentiment', 'Sentiment_Score', 'Post_Reactions', 'Post_Author_Name']
+
+def generate_sentiment_report(csv_file, report_file, rows=None):
     print(f"[*] Generating sentiment analysis report from {csv_file}...")
     
-    sentiments = []
-    sentiment_scores = []
-    reactions = []
-    authors = []
-    
     try:
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                sentiment = row.get('Sentiment', 'neutral')
-                score = float(row.get('Sentiment_Score', 0.0))
-                reaction_count = int(row.get('Post_Reactions', 0))
-                author = row.get('Post_Author_Name', 'Unknown')
-                
-                sentiments.append(sentiment)
-                sentiment_scores.append(score)
-                reactions.append(reaction_count)
-                authors.append(author)
-    
+        if rows is not None:
+            # Rows already in memory from backfill_sentiment; no need to read the file again
+            df = pd.DataFrame.from_records(rows, columns=_REPORT_COLUMNS)
+        else:
+            # Text columns stay strings (no type sniffing on author names); blank numeric cells
+            # become NaN so the C parser can type those columns as numbers directly
+            df = pd.read_csv(
+                csv_file,
+                usecols=_REPORT_COLUMNS,
+                dtype={'Sentiment': str, 'Post_Author_Name': str},
+                keep_default_na=False,
+                na_values={'Sentiment_Score': [''], 'Post_Reactions': ['']},
+                index_col=False,
+            )
     except FileNotFoundError:
         print(f"[!] Error: {csv_file} not found")
         return
@@ -223,13 +353,16 @@ def generate_sentiment_report(csv_file, report_file):
         print(f"[!] Error reading {csv_file}: {e}")
         return
     
-    if not sentiments:
+    if df.empty:
         print("[!] No data found for sentiment analysis")
         return
     
+    sentiment_scores = pd.to_numeric(df['Sentiment_Score'], errors='coerce').fillna(0.0)
+    reactions = pd.to_numeric(df['Post_Reactions'], errors='coerce').fillna(0).astype('int64')
+    
     # Calculate statistics
-    total_posts = len(sentiments)
-    sentiment_counts = Counter(sentiments)
+    total_posts = len(df)
+    sentiment_counts = df['Sentiment'].value_counts().reindex(['positive', 'negative', 'neutral'], fill_value=0)
     
     # Calculate percentages
     positive_pct = (sentiment_counts['positive'] / total_posts) * 100
@@ -237,110 +370,110 @@ def generate_sentiment_report(csv_file, report_file):
     neutral_pct = (sentiment_counts['neutral'] / total_posts) * 100
     
     # Calculate average sentiment score
-    avg_sentiment_score = sum(sentiment_scores) / len(sentiment_scores)
+    avg_sentiment_score = sentiment_scores.mean()
     
     # Calculate reactions statistics
-    total_reactions = sum(reactions)
+    total_reactions = int(reactions.sum())
     avg_reactions = total_reactions / total_posts if total_posts > 0 else 0
-    max_reactions = max(reactions) if reactions else 0
-    min_reactions = min(reactions) if reactions else 0
+    max_reactions = int(reactions.max())
+    min_reactions = int(reactions.min())
     
-    # Author statistics
-    author_counts = Counter(authors)
-    most_active_author = author_counts.most_common(1)[0] if author_counts else ("Unknown", 0)
-    unique_authors = len(set(authors))
+    # Author statistics; a stable sort keeps tied authors in order of first appearance
+    author_counts = df['Post_Author_Name'].value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    most_active_author = (author_counts.index[0], int(author_counts.iloc[0]))
+    unique_authors = len(author_counts)
     
     # Sentiment by reaction correlation
-    positive_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'positive']
-    negative_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'negative']
-    neutral_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'neutral']
-    
-    avg_positive_reactions = sum(positive_reactions) / len(positive_reactions) if positive_reactions else 0
-    avg_negative_reactions = sum(negative_reactions) / len(negative_reactions) if negative_reactions else 0
-    avg_neutral_reactions = sum(neutral_reactions) / len(neutral_reactions) if neutral_reactions else 0
+    reaction_means = reactions.groupby(df['Sentiment']).mean()
+    avg_positive_reactions = reaction_means.get('positive', 0)
+    avg_negative_reactions = reaction_means.get('negative', 0)
+    avg_neutral_reactions = reaction_means.get('neutral', 0)
     
     # Generate report timestamp
     report_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Write sentiment analysis report
-    with open(report_file, 'w', encoding='utf-8', newline='') as file:
-        writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-        
-        # Write header
-        writer.writerow(["Sentiment Analysis Report", ""])
-        writer.writerow(["Generated on", report_timestamp])
-        writer.writerow(["Source File", csv_file])
-        writer.writerow(["", ""])
-        
-        # Overall statistics
-        writer.writerow(["OVERALL STATISTICS", ""])
-        writer.writerow(["Total Posts Analyzed", total_posts])
-        writer.writerow(["Total Reactions", total_reactions])
-        writer.writerow(["Unique Authors", unique_authors])
-        writer.writerow(["", ""])
-        
-        # Sentiment distribution
-        writer.writerow(["SENTIMENT DISTRIBUTION", ""])
-        writer.writerow(["Positive Posts", f"{sentiment_counts['positive']} ({positive_pct:.1f}%)"])
-        writer.writerow(["Negative Posts", f"{sentiment_counts['negative']} ({negative_pct:.1f}%)"])
-        writer.writerow(["Neutral Posts", f"{sentiment_counts['neutral']} ({neutral_pct:.1f}%)"])
-        writer.writerow(["Average Sentiment Score", f"{avg_sentiment_score:.3f}"])
-        writer.writerow(["", ""])
-        
-        # Reaction statistics
-        writer.writerow(["REACTION STATISTICS", ""])
-        writer.writerow(["Average Reactions per Post", f"{avg_reactions:.1f}"])
-        writer.writerow(["Maximum Reactions", max_reactions])
-        writer.writerow(["Minimum Reactions", min_reactions])
-        writer.writerow(["", ""])
-        
-        # Sentiment-Reaction correlation
-        writer.writerow(["SENTIMENT-REACTION CORRELATION", ""])
-        writer.writerow(["Avg Reactions - Positive Posts", f"{avg_positive_reactions:.1f}"])
-        writer.writerow(["Avg Reactions - Negative Posts", f"{avg_negative_reactions:.1f}"])
-        writer.writerow(["Avg Reactions - Neutral Posts", f"{avg_neutral_reactions:.1f}"])
-        writer.writerow(["", ""])
-        
-        # Author statistics
-        writer.writerow(["AUTHOR STATISTICS", ""])
-        writer.writerow(["Most Active Author", f"{most_active_author[0]} ({most_active_author[1]} posts)"])
-        writer.writerow(["", ""])
-        
-        # Top authors by post count
-        writer.writerow(["TOP AUTHORS BY POST COUNT", ""])
-        writer.writerow(["Author", "Post Count"])
-        for author, count in author_counts.most_common(10):  # Top 10 authors
-            writer.writerow([author, count])
-        
-        # Sentiment interpretation
-        writer.writerow(["", ""])
-        writer.writerow(["SENTIMENT INTERPRETATION", ""])
-        if avg_sentiment_score > 0.1:
-            overall_sentiment = "Overall Positive"
-        elif avg_sentiment_score < -0.1:
-            overall_sentiment = "Overall Negative"
-        else:
-            overall_sentiment = "Overall Neutral"
-        
-        writer.writerow(["Overall Sentiment", overall_sentiment])
-        writer.writerow(["Sentiment Score Range", "-1.0 (very negative) to +1.0 (very positive)"])
-        writer.writerow(["", ""])
-        
-        # Recommendations
-        writer.writerow(["INSIGHTS & RECOMMENDATIONS", ""])
-        if positive_pct > 60:
-            writer.writerow(["Content Performance", "Strong positive sentiment - continue current strategy"])
-        elif negative_pct > 40:
-            writer.writerow(["Content Performance", "High negative sentiment - review content strategy"])
-        else:
-            writer.writerow(["Content Performance", "Mixed sentiment - monitor trends"])
-        
-        if avg_positive_reactions > avg_negative_reactions * 1.5:
-            writer.writerow(["Engagement Pattern", "Positive content generates more engagement"])
-        elif avg_negative_reactions > avg_positive_reactions * 1.5:
-            writer.writerow(["Engagement Pattern", "Negative content generates more engagement"])
-        else:
-            writer.writerow(["Engagement Pattern", "Similar engagement across sentiment types"])
+    # Collect the report rows, then write them in one go
+    report_rows = []
+    
+    # Write header
+    report_rows.append(["Sentiment Analysis Report", ""])
+    report_rows.append(["Generated on", report_timestamp])
+    report_rows.append(["Source File", csv_file])
+    report_rows.append(["", ""])
+    
+    # Overall statistics
+    report_rows.append(["OVERALL STATISTICS", ""])
+    report_rows.append(["Total Posts Analyzed", total_posts])
+    report_rows.append(["Total Reactions", total_reactions])
+    report_rows.append(["Unique Authors", unique_authors])
+    report_rows.append(["", ""])
+    
+    # Sentiment distribution
+    report_rows.append(["SENTIMENT DISTRIBUTION", ""])
+    report_rows.append(["Positive Posts", f"{sentiment_counts['positive']} ({positive_pct:.1f}%)"])
+    report_rows.append(["Negative Posts", f"{sentiment_counts['negative']} ({negative_pct:.1f}%)"])
+    report_rows.append(["Neutral Posts", f"{sentiment_counts['neutral']} ({neutral_pct:.1f}%)"])
+    report_rows.append(["Average Sentiment Score", f"{avg_sentiment_score:.3f}"])
+    report_rows.append(["", ""])
+    
+    # Reaction statistics
+    report_rows.append(["REACTION STATISTICS", ""])
+    report_rows.append(["Average Reactions per Post", f"{avg_reactions:.1f}"])
+    report_rows.append(["Maximum Reactions", max_reactions])
+    report_rows.append(["Minimum Reactions", min_reactions])
+    report_rows.append(["", ""])
+    
+    # Sentiment-Reaction correlation
+    report_rows.append(["SENTIMENT-REACTION CORRELATION", ""])
+    report_rows.append(["Avg Reactions - Positive Posts", f"{avg_positive_reactions:.1f}"])
+    report_rows.append(["Avg Reactions - Negative Posts", f"{avg_negative_reactions:.1f}"])
+    report_rows.append(["Avg Reactions - Neutral Posts", f"{avg_neutral_reactions:.1f}"])
+    report_rows.append(["", ""])
+    
+    # Author statistics
+    report_rows.append(["AUTHOR STATISTICS", ""])
+    report_rows.append(["Most Active Author", f"{most_active_author[0]} ({most_active_author[1]} posts)"])
+    report_rows.append(["", ""])
+    
+    # Top authors by post count
+    report_rows.append(["TOP AUTHORS BY POST COUNT", ""])
+    report_rows.append(["Author", "Post Count"])
+    for author, count in author_counts.head(10).items():  # Top 10 authors
+        report_rows.append([author, count])
+    
+    # Sentiment interpretation
+    report_rows.append(["", ""])
+    report_rows.append(["SENTIMENT INTERPRETATION", ""])
+    if avg_sentiment_score > 0.1:
+        overall_sentiment = "Overall Positive"
+    elif avg_sentiment_score < -0.1:
+        overall_sentiment = "Overall Negative"
+    else:
+        overall_sentiment = "Overall Neutral"
+    
+    report_rows.append(["Overall Sentiment", overall_sentiment])
+    report_rows.append(["Sentiment Score Range", "-1.0 (very negative) to +1.0 (very positive)"])
+    report_rows.append(["", ""])
+    
+    # Recommendations
+    report_rows.append(["INSIGHTS & RECOMMENDATIONS", ""])
+    if positive_pct > 60:
+        report_rows.append(["Content Performance", "Strong positive sentiment - continue current strategy"])
+    elif negative_pct > 40:
+        report_rows.append(["Content Performance", "High negative sentiment - review content strategy"])
+    else:
+        report_rows.append(["Content Performance", "Mixed sentiment - monitor trends"])
+    
+    if avg_positive_reactions > avg_negative_reactions * 1.5:
+        report_rows.append(["Engagement Pattern", "Positive content generates more engagement"])
+    elif avg_negative_reactions > avg_positive_reactions * 1.5:
+        report_rows.append(["Engagement Pattern", "Negative content generates more engagement"])
+    else:
+        report_rows.append(["Engagement Pattern", "Similar engagement across sentiment types"])
+    
+    report = pd.DataFrame(report_rows)
+    with open(report_file, 'w', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+        report.to_csv(file, header=False, index=False, quoting=csv.QUOTE_ALL, lineterminator='\r\n')
     
     print(f"[*] Sentiment analysis report generated: {report_file}")
     print(f"[*] Report Summary:")
@@ -351,6 +484,156 @@ def generate_sentiment_report(csv_file, report_file):
     print(f"    - Average sentiment score: {avg_sentiment_score:.3f}")
     print(f"    - Overall sentiment: {overall_sentiment}")
 
+# ---------------------------------------------------------------------------------------
+# Numeric post ID inside an activity URN or a details-page link
+# ---------------------------------------------------------------------------------------
+_ACTIVITY_ID_RE = re.compile(r'urn:li:activity:(\d+)')
+
+# ---------------------------------------------------------------------------------------
+# In-browser extraction of post fields
+# ---------------------------------------------------------------------------------------
+# Runs inside Chrome so all DOM traversal happens natively and each scroll costs a single
+# WebDriver round-trip. LinkedIn appends new posts to the feed without reordering, so
+# wrappers already walked in a previous pass keep their position and are skipped by index.
+# Called with the index to resume from as arguments[0] and the number of wrappers walked
+# so far as arguments[1]. Returns the next resume index, the current wrapper count, the raw
+# fields of each newly extracted post and the number of newly walked wrappers skipped as
+# already known, as one JSON string so Selenium hands back a single value instead of
+# walking every nested list and dict. A wrapper without an activity ID yet stops the
+# resume index there, so the next pass looks at it again. So does a post whose author or
+# text has not rendered yet: it is left out and retried on up to arguments[2] later passes
+# (counted per post in window.__deferredPostTries) before being taken as it is, since some
+# posts really have no text. Wrappers whose activity ID is in
+# window.__knownPostIds (seeded from the CSV by _REGISTER_KNOWN_IDS_JS, then grown with
+# every post returned) are counted but not extracted. If the feed was re-rendered and
+# shrank, it starts over from the first wrapper.
+# Text is collected like BeautifulSoup's get_text(separator, strip=True) so the
+# Python-side cleaning sees the same strings.
+_NEW_POSTS_JS = """
+function strippedText(element, separator) {
+    const parts = [];
+    const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const text = walker.currentNode.nodeValue.trim();
+        if (text) parts.push(text);
+    }
+    return parts.join(separator);
+}
+
+function attribute(element, name) {
+    return element && element.hasAttribute(name) ? element.getAttribute(name) : null;
+}
+
+function activityId(value) {
+    const match = value && /urn:li:activity:(\\d+)/.exec(value);
+    return match ? match[1] : null;
+}
+
+const known = window.__knownPostIds || (window.__knownPostIds = new Set());
+const deferred = window.__deferredPostTries || (window.__deferredPostTries = new Map());
+const wrappers = document.querySelectorAll('div.feed-shared-update-v2');
+const rerendered = wrappers.length < arguments[1];
+const start = rerendered ? 0 : arguments[0];
+const walked = rerendered ? 0 : arguments[1];
+const posts = [];
+let resumeAt = wrappers.length;
+let knownSkipped = 0;
+for (let i = start; i < wrappers.length; i++) {
+    const wrapper = wrappers[i];
+    const detailHref = attribute(wrapper.querySelector('a.update-components-mini-update-v2__link-to-details-page'), 'href');
+    const dataUrn = attribute(wrapper, 'data-urn');
+    const postId = activityId(detailHref) || activityId(dataUrn);
+    if (!postId) {
+        resumeAt = Math.min(resumeAt, i);
+        continue;
+    }
+    if (known.has(postId)) {
+        if (i >= walked) knownSkipped++;
+        continue;
+    }
+
+    const post = {
+        detailHref: detailHref,
+        dataUrn: dataUrn,
+        authorName: null,
+        authorNameDoubled: false,
+        authorProfile: null,
+        authorJobTitle: null,
+        authorJobTitleDoubled: false,
+        content: null,
+        reactionsLabel: null
+    };
+
+    const actor = wrapper.querySelector('div.update-components-actor__container');
+    if (actor) {
+        const title = actor.querySelector('span.update-components-actor__title');
+        const nameSpan = title && title.querySelector('span[dir="ltr"]');
+        if (nameSpan) {
+            // Labels are rendered twice: an aria-hidden visible copy and a screen-reader copy.
+            // Read the visible one when present; otherwise flag the text for halving in Python.
+            const visibleName = nameSpan.querySelector('span[aria-hidden="true"]');
+            post.authorName = strippedText(visibleName || nameSpan, '');
+            post.authorNameDoubled = !visibleName;
+        }
+        post.authorProfile = attribute(actor.querySelector('a.update-components-actor__meta-link'), 'href');
+        const description = actor.querySelector('span.update-components-actor__description');
+        if (description) {
+            const visibleJobTitle = description.querySelector('span[aria-hidden="true"]');
+            post.authorJobTitle = strippedText(visibleJobTitle || description, '');
+            post.authorJobTitleDoubled = !visibleJobTitle;
+        }
+    }
+
+    const text = wrapper.querySelector('div.update-components-text');
+    if (text) post.content = strippedText(text, '\\n');
+
+    const counts = wrapper.querySelector('div.social-details-social-counts');
+    const reactions = counts && counts.querySelector('li.social-details-social-counts__reactions');
+    post.reactionsLabel = attribute(reactions && reactions.querySelector('button'), 'aria-label');
+
+    if (!post.authorName || post.content === null) {
+        const tries = deferred.get(postId) || 0;
+        if (tries < arguments[2]) {
+            deferred.set(postId, tries + 1);
+            resumeAt = Math.min(resumeAt, i);
+            continue;
+        }
+    }
+    deferred.delete(postId);
+    known.add(postId);
+    posts.push(post);
+}
+return JSON.stringify([resumeAt, wrappers.length, posts, knownSkipped]);
+"""
+
+# Post IDs go over as strings: 19-digit activity IDs do not fit in a JavaScript number
+_REGISTER_KNOWN_IDS_JS = "window.__knownPostIds = new Set(arguments[0]);"
+
+# ---------------------------------------------------------------------------------------
+# In-browser scroll that waits only as long as new posts take to load
+# ---------------------------------------------------------------------------------------
+# Run with execute_async_script. Scrolls to the bottom, then polls the number of post
+# wrappers every 100 ms and calls back as soon as it grows, or after arguments[0]
+# milliseconds. Counting posts rather than page height ignores spinners and other
+# placeholders that grow the page without adding anything to scrape. Polling in the page
+# also avoids a WebDriver round-trip per check. The callback receives whether new posts
+# were appended.
+_SCROLL_AND_WAIT_JS = """
+const maxWait = arguments[0];
+const done = arguments[arguments.length - 1];
+const postCount = () => document.querySelectorAll('div.feed-shared-update-v2').length;
+const startCount = postCount();
+const start = Date.now();
+window.scrollTo(0, document.body.scrollHeight);
+const timer = setInterval(() => {
+    const grew = postCount() > startCount;
+    if (grew || Date.now() - start > maxWait) {
+        clearInterval(timer);
+        done(grew);
+    }
+}, 100);
+"""
+
 # ---------------------------------------------------------------------------------------
 # Main script
 # ---------------------------------------------------------------------------------------
@@ -362,11 +645,13 @@ def main():
     MAX_POSTS = 1000
     MAX_SCROLL_ATTEMPTS = 80
     MAX_NO_NEW_POSTS_IN_A_ROW = 50
+    CSV_BATCH_SIZE = 50
+    LOAD_PAUSE_TIME = 4
+    MAX_RENDER_RETRIES = 3
 
     # --------------------------------
-    # Initialize CSV file and load existing post IDs
+    # Load existing post IDs
     # --------------------------------
-    initialize_csv_file(csv_file)
     existing_post_ids = load_existing_post_ids(csv_file)
     
     # -------------------------------- 
@@ -382,6 +667,8 @@ def main():
     browser = uc.Chrome(options=chrome_options)
     print("[*] Setting window size...")
     browser.set_window_size(1920, 1080)
+    # Leave headroom over the in-page scroll wait before Selenium gives up on the script
+    browser.set_script_timeout(LOAD_PAUSE_TIME + 2)
 
     # --------------------------------
     # Log in using cookies
@@ -406,143 +693,133 @@ def main():
     print(f"[*] Navigating to {search_url} ...")
     browser.get(search_url)
     time.sleep(5)
+    # Let the in-page extraction skip posts already in the CSV without reading their fields
+    browser.execute_script(_REGISTER_KNOWN_IDS_JS, [str(post_id) for post_id in existing_post_ids])
 
     new_posts_added = 0
     total_posts_processed = 0
     skipped_duplicates = 0
-    LOAD_PAUSE_TIME = 4
     scroll_attempts = 0
     no_new_posts_count = 0
+    resume_wrapper = 0
+    walked_wrappers = 0
 
     print("[*] Starting to scroll and collect post data...")
     print(f"[*] Will skip posts already in database. Currently have {len(existing_post_ids)} existing posts.")
     
-    while new_posts_added < MAX_POSTS and scroll_attempts < MAX_SCROLL_ATTEMPTS and no_new_posts_count < MAX_NO_NEW_POSTS_IN_A_ROW:
-        soup = bs(browser.page_source, "html.parser")
-        post_wrappers = soup.find_all("div", {"class": "feed-shared-update-v2"})
-        new_posts_in_this_pass = 0
-
-        for pw in post_wrappers:
-            post_id = None
-            detail_link_tag = pw.find("a", {"class": "update-components-mini-update-v2__link-to-details-page"})
-            if detail_link_tag and detail_link_tag.get("href"):
-                post_url = detail_link_tag["href"].strip()
-                if "urn:li:activity:" in post_url:
-                    post_id = post_url.split("urn:li:activity:")[-1].replace("/", "")
-            if not post_id:
-                data_urn = pw.get("data-urn", "")
-                if "urn:li:activity:" in data_urn:
-                    post_id = data_urn.split("urn:li:activity:")[-1]
-            if not post_id:
-                continue
-
-            total_posts_processed += 1
-
-            # Check if post already exists
-            if post_id in existing_post_ids:
-                skipped_duplicates += 1
-                continue
-
-            # Add to existing_post_ids to avoid processing same post again in this session
-            existing_post_ids.add(post_id)
-            new_posts_in_this_pass += 1
-
-            author_name = None
-            author_profile_link = None
-            author_jobtitle = None
-            actor_container = pw.find("div", {"class": "update-components-actor__container"})
-            if actor_container:
-                name_tag = actor_container.find("span", {"class": "update-components-actor__title"})
-                if name_tag:
-                    inner_span = name_tag.find("span", {"dir": "ltr"})
-                    if inner_span:
-                        raw_name = inner_span.get_text(strip=True)
-                        # Always take first half since it's always duplicated
-                        if raw_name:
-                            words = raw_name.split()
-                            if len(words) >= 2:
-                                mid = len(words) // 2
-                                author_name = ' '.join(words[:mid])
-                            else:
-                                author_name = raw_name
-                
-                actor_link = actor_container.find("a", {"class": "update-components-actor__meta-link"})
-                if actor_link and actor_link.get("href"):
-                    author_profile_link = actor_link["href"].strip()
-                    if author_profile_link.startswith("/in/"):
-                        author_profile_link = "https://www.linkedin.com" + author_profile_link
-                
-                jobtitle_tag = actor_container.find("span", {"class": "update-components-actor__description"})
-                if jobtitle_tag:
-                    raw_jobtitle = jobtitle_tag.get_text(strip=True)
-                    # Always take first half since it's always duplicated
+    # Keep one handle and writer open for the whole scrape instead of reopening per row
+    with open(csv_file, mode='a', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as csv_handle:
+        writer = csv.writer(csv_handle, quoting=csv.QUOTE_ALL)
+        initialize_csv_file(csv_file, csv_handle, writer)
+        pending_rows = []
+
+        try:
+            while new_posts_added < MAX_POSTS and scroll_attempts < MAX_SCROLL_ATTEMPTS and no_new_posts_count < MAX_NO_NEW_POSTS_IN_A_ROW:
+                # One WebDriver round-trip returns the fields of the posts appended since the last pass
+                resume_wrapper, walked_wrappers, new_posts, known_skipped = json.loads(
+                    browser.execute_script(_NEW_POSTS_JS, resume_wrapper, walked_wrappers, MAX_RENDER_RETRIES)
+                )
+                total_posts_processed += known_skipped
+                skipped_duplicates += known_skipped
+                new_posts_in_this_pass = 0
+                # All posts collected in one pass share a timestamp
+                date_collected = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+                for post in new_posts:
+                    # Prefer the details-page link (reshares point at the original post)
+                    id_match = _ACTIVITY_ID_RE.search(post['detailHref'] or "") or _ACTIVITY_ID_RE.search(post['dataUrn'] or "")
+                    if not id_match:
+                        continue
+                    post_id = int(id_match.group(1))
+
+                    total_posts_processed += 1
+
+                    # Check if post already exists
+                    if post_id in existing_post_ids:
+                        skipped_duplicates += 1
+                        continue
+
+                    # Add to existing_post_ids to avoid processing same post again in this session
+                    existing_post_ids.add(post_id)
+                    new_posts_in_this_pass += 1
+
+                    author_name = None
+                    raw_name = post['authorName']
+                    # Without a separate visible copy the text holds both copies, so take the first half
+                    if raw_name:
+                        author_name = take_first_half(raw_name) if post['authorNameDoubled'] else raw_name
+
+                    author_profile_link = None
+                    if post['authorProfile']:
+                        author_profile_link = post['authorProfile'].strip()
+                        if author_profile_link.startswith("/in/"):
+                            author_profile_link = "https://www.linkedin.com" + author_profile_link
+
+                    author_jobtitle = None
+                    raw_jobtitle = post['authorJobTitle']
+                    # Without a separate visible copy the text holds both copies, so take the first half
                     if raw_jobtitle:
-                        words = raw_jobtitle.split()
-                        if len(words) >= 2:
-                            mid = len(words) // 2
-                            author_jobtitle = ' '.join(words[:mid])
-                        else:
-                            author_jobtitle = raw_jobtitle
+                        author_jobtitle = take_first_half(raw_jobtitle) if post['authorJobTitleDoubled'] else raw_jobtitle
                         # Clean the job title
                         author_jobtitle = clean_post_content(author_jobtitle)
 
-            post_content = None
-            content_div = pw.find("div", {"class": "update-components-text"})
-            if content_div:
-                raw_content = content_div.get_text(separator="\n", strip=True)
-                post_content = clean_post_content(raw_content)
-
-            # Analyze sentiment of the post content
-            sentiment, sentiment_score = analyze_sentiment(post_content)
-
-            post_reactions = 0
-            social_counts_div = pw.find("div", {"class": "social-details-social-counts"})
-            if social_counts_div:
-                reaction_item = social_counts_div.find("li", {"class": "social-details-social-counts__reactions"})
-                if reaction_item:
-                    button_tag = reaction_item.find("button")
-                    if button_tag and button_tag.has_attr("aria-label"):
-                        raw_reactions = button_tag["aria-label"].split(" ")[0]
-                        post_reactions = convert_abbreviated_to_number(raw_reactions)
+                    post_content = None
+                    if post['content'] is not None:
+                        post_content = clean_post_content(post['content'])
 
-            date_collected = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-
-            # Prepare post data
-            post_data = [
-                post_id or "",
-                author_name or "",
-                author_profile_link or "",
-                author_jobtitle or "",
-                post_content or "",
-                post_reactions,
-                sentiment,
-                sentiment_score,
-                date_collected
-            ]
-
-            # Append to CSV file
-            append_post_to_csv(csv_file, post_data)
-
-            new_posts_added += 1
-            print(f"[+] Added NEW Post ID {post_id}. New posts added: {new_posts_added}")
-            print(f"    Author: {author_name} | {author_profile_link}")
-            print(f"    Content snippet: {post_content[:70]}{'...' if len(post_content or '')>70 else ''}")
-            print(f"    Sentiment: {sentiment} ({sentiment_score})")
-            print(f"    Progress: {new_posts_added}/{MAX_POSTS} new posts | {skipped_duplicates} duplicates skipped")
-
-            if new_posts_added >= MAX_POSTS:
-                break
-
-        if new_posts_in_this_pass == 0:
-            no_new_posts_count += 1
-        else:
-            no_new_posts_count = 0
+                    post_reactions = 0
+                    if post['reactionsLabel'] is not None:
+                        raw_reactions = post['reactionsLabel'].split(" ")[0]
+                        post_reactions = convert_abbreviated_to_number(raw_reactions)
 
-        if new_posts_added < MAX_POSTS:
-            print(f"[*] Scrolling to load more posts... (Attempt {scroll_attempts + 1}/{MAX_SCROLL_ATTEMPTS})")
-            browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(LOAD_PAUSE_TIME)
-            scroll_attempts += 1
+                    # Prepare post data
+                    post_data = [
+                        post_id,
+                        author_name or "",
+                        author_profile_link or "",
+                        author_jobtitle or "",
+                        post_content or "",
+                        post_reactions,
+                        "",  # Sentiment is filled in by backfill_sentiment after scraping
+                        "",
+                        date_collected
+                    ]
+
+                    # Queue for the CSV file; rows are written and flushed in batches so a crash
+                    # loses at most one batch
+                    pending_rows.append(post_data)
+                    if len(pending_rows) >= CSV_BATCH_SIZE:
+                        writer.writerows(pending_rows)
+                        pending_rows.clear()
+                        csv_handle.flush()
+
+                    new_posts_added += 1
+                    print(f"[+] Added NEW Post ID {post_id}. New posts added: {new_posts_added}")
+                    print(f"    Author: {author_name} | {author_profile_link}")
+                    print(f"    Content snippet: {post_content[:70]}{'...' if len(post_content or '')>70 else ''}")
+                    print(f"    Progress: {new_posts_added}/{MAX_POSTS} new posts | {skipped_duplicates} duplicates skipped")
+
+                    if new_posts_added >= MAX_POSTS:
+                        break
+
+                if new_posts_in_this_pass == 0:
+                    no_new_posts_count += 1
+                else:
+                    no_new_posts_count = 0
+
+                if new_posts_added < MAX_POSTS:
+                    print(f"[*] Scrolling to load more posts... (Attempt {scroll_attempts + 1}/{MAX_SCROLL_ATTEMPTS})")
+                    # Returns as soon as new posts appear instead of always sleeping LOAD_PAUSE_TIME
+                    try:
+                        feed_grew = browser.execute_async_script(_SCROLL_AND_WAIT_JS, LOAD_PAUSE_TIME * 1000)
+                    except TimeoutException:
+                        feed_grew = False
+                    if not feed_grew:
+                        print(f"[*] No new posts loaded within {LOAD_PAUSE_TIME}s of scrolling.")
+                    scroll_attempts += 1
+        finally:
+            # Write whatever is left of the last batch, even if the scrape stopped on an error
+            writer.writerows(pending_rows)
 
     print(f"\n[*] Scraping completed!")
     print(f"    - Total posts processed: {total_posts_processed}")
@@ -553,10 +830,12 @@ def main():
     browser.quit()
     print(f"[*] Data appended to {csv_file}")
     
-    # Generate sentiment analysis report
+    # Score the newly scraped posts in one pass now that the browser is closed, then
+    # generate the sentiment analysis report
     if new_posts_added > 0:
+        scored_rows = backfill_sentiment(csv_file)
         print("[*] Generating updated sentiment analysis report...")
-        generate_sentiment_report(csv_file, sentiment_report_file)
+        generate_sentiment_report(csv_file, sentiment_report_file, scored_rows)
     else:
         print("[*] No new posts added, skipping sentiment report generation.")
 
@@ -2,30 +2,70 @@ import csv
 import os
 import sys
 from datetime import datetime
-from collections import Counter
 import argparse
+import importlib.util
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
 
-# For sentiment analysis
-try:
-    from textblob import TextBlob
-    SENTIMENT_AVAILABLE = True
-except ImportError:
+import pandas as pd
+
+# For sentiment analysis (TextBlob itself is only imported on first use, so --help
+# and report-only runs don't pay for loading it)
+SENTIMENT_AVAILABLE = importlib.util.find_spec("textblob") is not None
+if not SENTIMENT_AVAILABLE:
     print("[!] TextBlob not installed. Install with: pip install textblob")
     print("[!] Run: pip install textblob")
     print("[!] Then run: python -m textblob.download_corpora")
-    SENTIMENT_AVAILABLE = False
+
+# TextBlob's default sentiment is this module-level lexicon scorer; calling it directly
+# skips building a TextBlob (and its tokenizer setup) for every post
+_pattern_sentiment = None
+
+# Large buffer for the sequential CSV reads and writes; far fewer syscalls on big files
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Line breaks are flattened to spaces in one pass when building content previews
+_PREVIEW_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Reshares repeat the same text, so results are cached per content. Texts longer than
+# _LONG_TEXT_CHARS are cached under their MD5 digest instead, so the cache holds short
+# keys rather than whole long posts; both caches drop their least recently used entries
+# past _SENTIMENT_CACHE_SIZE.
+_SENTIMENT_CACHE_SIZE = 200000
+_LONG_TEXT_CHARS = 2048
+_long_text_results = OrderedDict()
 
 # ---------------------------------------------------------------------------------------
 # Helper function to analyze sentiment of text
 # ---------------------------------------------------------------------------------------
 def analyze_sentiment(text):
-    """Analyze sentiment of given text using TextBlob"""
-    if not SENTIMENT_AVAILABLE or not text:
+    """Analyze sentiment of given text using TextBlob's lexicon scorer"""
+    # Blank posts (reshares without commentary) can't match the lexicon; skip the scorer
+    if not text or text.isspace():
+        return "neutral", 0.0
+    
+    if len(text) > _LONG_TEXT_CHARS:
+        key = hashlib.md5(text.encode('utf-8')).digest()
+        result = _long_text_results.get(key)
+        if result is None:
+            result = _long_text_results[key] = _score_sentiment(text)
+            if len(_long_text_results) > _SENTIMENT_CACHE_SIZE:
+                _long_text_results.popitem(last=False)
+        else:
+            _long_text_results.move_to_end(key)
+        return result
+    return _score_sentiment_cached(text)
+
+def _score_sentiment(text):
+    """Classify text by polarity; the uncached core of analyze_sentiment"""
+    if _pattern_sentiment is None and not load_sentiment_scorer():
         return "neutral", 0.0
     
     try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
+        polarity = _pattern_sentiment(text)[0]
         
         # Classify sentiment based on polarity
         if polarity > 0.1:
@@ -40,6 +80,52 @@ def analyze_sentiment(text):
         print(f"[!] Error analyzing sentiment: {e}")
         return "neutral", 0.0
 
+_score_sentiment_cached = lru_cache(maxsize=_SENTIMENT_CACHE_SIZE)(_score_sentiment)
+
+def _analyze_sentiment_unavailable(text):
+    """Fallback used when TextBlob is not installed"""
+    return "neutral", 0.0
+
+# Without TextBlob every post is neutral, so skip the checks above entirely
+if not SENTIMENT_AVAILABLE:
+    analyze_sentiment = _analyze_sentiment_unavailable
+
+def load_sentiment_scorer():
+    """Import the lexicon scorer once; a broken TextBlob install is treated like a missing one"""
+    global _pattern_sentiment, SENTIMENT_AVAILABLE, analyze_sentiment
+    if SENTIMENT_AVAILABLE and _pattern_sentiment is None:
+        try:
+            from textblob.en import sentiment as _pattern_sentiment
+        except ImportError as e:
+            print(f"[!] TextBlob could not be imported: {e}")
+            print("[!] Run: pip install textblob")
+            print("[!] Then run: python -m textblob.download_corpora")
+            SENTIMENT_AVAILABLE = False
+            analyze_sentiment = _analyze_sentiment_unavailable
+    return SENTIMENT_AVAILABLE
+
+# Below this many posts scoring stays in-process, where it finishes before a pool of
+# workers would have started
+_PARALLEL_SENTIMENT_MIN_POSTS = 500
+_SENTIMENT_CHUNK_SIZE = 256
+
+# Rows held in memory at a time while rewriting the CSV with sentiment filled in
+_UPDATE_BLOCK_ROWS = 20000
+
+# ---------------------------------------------------------------------------------------
+# Helper function to analyze sentiment of many texts, in parallel for large batches
+# ---------------------------------------------------------------------------------------
+def analyze_sentiments(texts, pool=None):
+    """Yield analyze_sentiment results for texts, in order, using pool for large batches"""
+    if pool is None or len(texts) < _PARALLEL_SENTIMENT_MIN_POSTS:
+        yield from map(analyze_sentiment, texts)
+        return
+    
+    # Keep chunks large enough to amortize pickling but small enough to share out evenly
+    workers = os.cpu_count() or 1
+    chunksize = max(1, min(_SENTIMENT_CHUNK_SIZE, len(texts) // (workers * 4)))
+    yield from pool.imap(analyze_sentiment, texts, chunksize=chunksize)
+
 # ---------------------------------------------------------------------------------------
 # Function to update CSV file with sentiment analysis
 # ---------------------------------------------------------------------------------------
@@ -49,22 +135,39 @@ def update_csv_with_sentiment(csv_file, backup=True):
         print(f"[!] Error: CSV file '{csv_file}' not found!")
         return False
     
+    # Scoring with a broken install would write neutral into every row for good, so the
+    # scorer is imported (once) before anything is touched
+    if not load_sentiment_scorer():
+        print("[!] TextBlob is required for sentiment analysis. Please install it first.")
+        return False
+    
     # Create backup if requested
     if backup:
         backup_file = f"{csv_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         print(f"[*] Creating backup: {backup_file}")
-        import shutil
-        shutil.copy2(csv_file, backup_file)
+        # A hard link is enough because the update below swaps in a new file rather than
+        # rewriting this one; copy when linking isn't possible (other filesystem, no support)
+        try:
+            os.link(csv_file, backup_file)
+        except OSError:
+            import shutil
+            shutil.copy2(csv_file, backup_file)
     
-    # Read existing data
-    rows = []
+    # Stream the file through in blocks, writing scored rows to a temporary file that
+    # replaces the original only once everything is written
     updated_count = 0
+    tmp_file = f"{csv_file}.tmp"
+    # Started on the first block big enough to need it, then shared by every later block so
+    # workers (and their sentiment caches) live for the whole update
+    pool = None
     
     print(f"[*] Reading data from {csv_file}...")
     try:
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldnames = reader.fieldnames
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as infile, \
+             open(tmp_file, 'w', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as outfile:
+            # Rows stay plain lists indexed through the header instead of a dict per row
+            reader = csv.reader(infile)
+            fieldnames = next(reader)
             
             # Check if sentiment columns exist
             if 'Sentiment' not in fieldnames:
@@ -72,31 +175,53 @@ def update_csv_with_sentiment(csv_file, backup=True):
             if 'Sentiment_Score' not in fieldnames:
                 fieldnames.append('Sentiment_Score')
             
-            for row in reader:
-                # Check if sentiment analysis is missing or empty
-                if not row.get('Sentiment') or not row.get('Sentiment_Score'):
-                    content = row.get('Post_Content', '')
-                    sentiment, score = analyze_sentiment(content)
-                    row['Sentiment'] = sentiment
-                    row['Sentiment_Score'] = score
+            column_count = len(fieldnames)
+            sentiment_index = fieldnames.index('Sentiment')
+            score_index = fieldnames.index('Sentiment_Score')
+            content_index = fieldnames.index('Post_Content') if 'Post_Content' in fieldnames else None
+            
+            writer = csv.writer(outfile, quoting=csv.QUOTE_ALL)
+            writer.writerow(fieldnames)
+            
+            rows = (row for row in reader if row)
+            while True:
+                block = list(islice(rows, _UPDATE_BLOCK_ROWS))
+                if not block:
+                    break
+                
+                # Short rows (including ones written before the sentiment columns existed) are padded
+                for row in block:
+                    if len(row) < column_count:
+                        row.extend([''] * (column_count - len(row)))
+                
+                # Check if sentiment analysis is missing or empty, then score those posts as one batch
+                pending_rows = [row for row in block if not row[sentiment_index] or not row[score_index]]
+                contents = [row[content_index] if content_index is not None else '' for row in pending_rows]
+                if pool is None and len(contents) >= _PARALLEL_SENTIMENT_MIN_POSTS:
+                    pool = Pool(processes=os.cpu_count() or 1)
+                for row, (sentiment, score) in zip(pending_rows, analyze_sentiments(contents, pool)):
+                    row[sentiment_index] = sentiment
+                    row[score_index] = score
                     updated_count += 1
                     
                     if updated_count % 100 == 0:
                         print(f"[*] Processed {updated_count} posts for sentiment analysis...")
                 
-                rows.append(row)
+                writer.writerows(block)
     
     except Exception as e:
-        print(f"[!] Error reading CSV file: {e}")
+        print(f"[!] Error updating CSV file: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         return False
+    finally:
+        if pool is not None:
+            pool.terminate()
     
     # Write updated data back
     print(f"[*] Writing updated data back to {csv_file}...")
     try:
-        with open(csv_file, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-            writer.writeheader()
-            writer.writerows(rows)
+        os.replace(tmp_file, csv_file)
         
         print(f"[*] Updated {updated_count} posts with sentiment analysis")
         return True
@@ -108,42 +233,47 @@ def update_csv_with_sentiment(csv_file, backup=True):
 # ---------------------------------------------------------------------------------------
 # Function to validate CSV file structure
 # ---------------------------------------------------------------------------------------
+_REQUIRED_COLUMNS = ['Post_ID', 'Post_Author_Name', 'Post_Content', 'Post_Reactions']
+
 def validate_csv_structure(csv_file):
     """Validate that the CSV file has the required columns"""
-    required_columns = ['Post_ID', 'Post_Author_Name', 'Post_Content', 'Post_Reactions']
-    
     try:
         with open(csv_file, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
-            fieldnames = reader.fieldnames or []
-            
-            missing_columns = [col for col in required_columns if col not in fieldnames]
-            
-            if missing_columns:
-                print(f"[!] Missing required columns: {missing_columns}")
-                print(f"[!] Available columns: {fieldnames}")
-                return False
-            
-            return True
+            return _has_required_columns(reader.fieldnames or [])
     
     except Exception as e:
         print(f"[!] Error validating CSV structure: {e}")
         return False
 
+def _has_required_columns(fieldnames):
+    """Check a header row for the required columns, reporting any that are missing"""
+    missing_columns = [col for col in _REQUIRED_COLUMNS if col not in fieldnames]
+    
+    if missing_columns:
+        print(f"[!] Missing required columns: {missing_columns}")
+        print(f"[!] Available columns: {fieldnames}")
+        return False
+    
+    return True
+
+# Columns the report reads; the optional ones fall back to these defaults when absent.
+# Post text and IDs are only needed for the detailed section, and post text is most of
+# the file, so they are left unparsed otherwise.
+_REPORT_COLUMNS = ['Post_Author_Name', 'Post_Reactions', 'Sentiment', 'Sentiment_Score', 'Date_Collected']
+_DETAILED_REPORT_COLUMNS = _REPORT_COLUMNS + ['Post_ID', 'Post_Content']
+_REPORT_COLUMN_DEFAULTS = {'Sentiment': 'neutral', 'Sentiment_Score': '0.0', 'Date_Collected': ''}
+
 # ---------------------------------------------------------------------------------------
 # Function to generate comprehensive sentiment analysis report
 # ---------------------------------------------------------------------------------------
 def generate_sentiment_report(csv_file, report_file=None, detailed=False):
-    """Generate a comprehensive sentiment analysis report from CSV data"""
+    """Generate a comprehensive sentiment analysis report from CSV data and return the post count"""
     
     if not os.path.exists(csv_file):
         print(f"[!] Error: CSV file '{csv_file}' not found!")
         return False
     
-    if not validate_csv_structure(csv_file):
-        print("[!] CSV file structure validation failed!")
-        return False
-    
     # Set default report filename if not provided
     if not report_file:
         base_name = os.path.splitext(csv_file)[0]
@@ -151,55 +281,45 @@ def generate_sentiment_report(csv_file, report_file=None, detailed=False):
     
     print(f"[*] Generating sentiment analysis report from {csv_file}...")
     
-    # Data containers
-    sentiments = []
-    sentiment_scores = []
-    reactions = []
-    authors = []
-    contents = []
-    dates = []
-    post_ids = []
-    
-    # Read and process data
+    # Read and process data; pandas parses in C and the statistics below run column-wise.
+    # The header is validated from the same handle, so the file is only opened once.
+    columns = _DETAILED_REPORT_COLUMNS if detailed else _REPORT_COLUMNS
     try:
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                sentiment = row.get('Sentiment', 'neutral')
-                try:
-                    score = float(row.get('Sentiment_Score', 0.0))
-                except (ValueError, TypeError):
-                    score = 0.0
-                
-                try:
-                    reaction_count = int(row.get('Post_Reactions', 0))
-                except (ValueError, TypeError):
-                    reaction_count = 0
-                
-                author = row.get('Post_Author_Name', 'Unknown')
-                content = row.get('Post_Content', '')
-                date = row.get('Date_Collected', '')
-                post_id = row.get('Post_ID', '')
-                
-                sentiments.append(sentiment)
-                sentiment_scores.append(score)
-                reactions.append(reaction_count)
-                authors.append(author)
-                contents.append(content)
-                dates.append(date)
-                post_ids.append(post_id)
-    
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+            header = next(csv.reader(file), [])
+            if not _has_required_columns(header):
+                print("[!] CSV file structure validation failed!")
+                return False
+            
+            df = pd.read_csv(
+                file,
+                header=None,
+                names=header,
+                usecols=[column for column in columns if column in header],
+                dtype=str,
+                keep_default_na=False,
+                index_col=False,
+            )
     except Exception as e:
         print(f"[!] Error reading {csv_file}: {e}")
         return False
     
-    if not sentiments:
+    if df.empty:
         print("[!] No data found for sentiment analysis")
         return False
     
+    # Optional columns get the same defaults missing values always had
+    for column, default in _REPORT_COLUMN_DEFAULTS.items():
+        if column not in df:
+            df[column] = default
+    
+    sentiments = df['Sentiment']
+    sentiment_scores = pd.to_numeric(df['Sentiment_Score'], errors='coerce').fillna(0.0)
+    reactions = pd.to_numeric(df['Post_Reactions'], errors='coerce').fillna(0).astype('int64')
+    
     # Calculate statistics
-    total_posts = len(sentiments)
-    sentiment_counts = Counter(sentiments)
+    total_posts = len(df)
+    sentiment_counts = sentiments.value_counts()
     
     # Calculate percentages
     positive_pct = (sentiment_counts.get('positive', 0) / total_posts) * 100
@@ -207,38 +327,36 @@ def generate_sentiment_report(csv_file, report_file=None, detailed=False):
     neutral_pct = (sentiment_counts.get('neutral', 0) / total_posts) * 100
     
     # Calculate average sentiment score
-    avg_sentiment_score = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+    avg_sentiment_score = sentiment_scores.mean()
     
     # Calculate reactions statistics
-    total_reactions = sum(reactions)
+    total_reactions = int(reactions.sum())
     avg_reactions = total_reactions / total_posts if total_posts > 0 else 0
-    max_reactions = max(reactions) if reactions else 0
-    min_reactions = min(reactions) if reactions else 0
+    max_reactions = int(reactions.max())
+    min_reactions = int(reactions.min())
     
-    # Author statistics
-    author_counts = Counter(authors)
-    most_active_author = author_counts.most_common(1)[0] if author_counts else ("Unknown", 0)
-    unique_authors = len(set(authors))
+    # Author statistics; a stable sort keeps tied authors in order of first appearance
+    author_counts = df['Post_Author_Name'].value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    most_active_author = (author_counts.index[0], int(author_counts.iloc[0]))
+    unique_authors = len(author_counts)
     
     # Sentiment by reaction correlation
-    positive_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'positive']
-    negative_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'negative']
-    neutral_reactions = [reactions[i] for i in range(len(sentiments)) if sentiments[i] == 'neutral']
-    
-    avg_positive_reactions = sum(positive_reactions) / len(positive_reactions) if positive_reactions else 0
-    avg_negative_reactions = sum(negative_reactions) / len(negative_reactions) if negative_reactions else 0
-    avg_neutral_reactions = sum(neutral_reactions) / len(neutral_reactions) if neutral_reactions else 0
-    
-    # Time-based analysis (if dates available)
-    date_analysis = {}
-    if dates and any(dates):
-        for i, date in enumerate(dates):
-            if date:
-                date_key = date.split(' ')[0]  # Extract date part
-                if date_key not in date_analysis:
-                    date_analysis[date_key] = {'positive': 0, 'negative': 0, 'neutral': 0, 'total': 0}
-                date_analysis[date_key][sentiments[i]] += 1
-                date_analysis[date_key]['total'] += 1
+    reaction_means = reactions.groupby(sentiments).mean()
+    avg_positive_reactions = reaction_means.get('positive', 0)
+    avg_negative_reactions = reaction_means.get('negative', 0)
+    avg_neutral_reactions = reaction_means.get('neutral', 0)
+    
+    # Time-based analysis (if dates available); groupby sorts the days as the old dict loop did
+    daily_counts = None
+    dated = df['Date_Collected'] != ''
+    if dated.any():
+        days = df.loc[dated, 'Date_Collected'].str.split(' ', n=1).str[0]  # Extract date part
+        daily_counts = (
+            sentiments[dated].groupby([days, sentiments[dated]]).size()
+            .unstack(fill_value=0)
+            .reindex(columns=['positive', 'negative', 'neutral'], fill_value=0)
+        )
+        daily_counts['total'] = daily_counts.sum(axis=1)
     
     # Generate report timestamp
     report_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -251,121 +369,132 @@ def generate_sentiment_report(csv_file, report_file=None, detailed=False):
     else:
         overall_sentiment = "Overall Neutral"
     
-    # Write sentiment analysis report
+    # Build the report rows, then write them in one pass
     try:
-        with open(report_file, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            
-            # Write header
-            writer.writerow(["LinkedIn Posts Sentiment Analysis Report", ""])
-            writer.writerow(["Generated on", report_timestamp])
-            writer.writerow(["Source File", csv_file])
-            writer.writerow(["Total Posts Analyzed", total_posts])
-            writer.writerow(["", ""])
-            
-            # Overall statistics
-            writer.writerow(["=== OVERALL STATISTICS ===", ""])
-            writer.writerow(["Total Posts", total_posts])
-            writer.writerow(["Total Reactions", f"{total_reactions:,}"])
-            writer.writerow(["Unique Authors", unique_authors])
-            writer.writerow(["Average Reactions per Post", f"{avg_reactions:.1f}"])
-            writer.writerow(["", ""])
-            
-            # Sentiment distribution
-            writer.writerow(["=== SENTIMENT DISTRIBUTION ===", ""])
-            writer.writerow(["Positive Posts", f"{sentiment_counts.get('positive', 0):,} ({positive_pct:.1f}%)"])
-            writer.writerow(["Negative Posts", f"{sentiment_counts.get('negative', 0):,} ({negative_pct:.1f}%)"])
-            writer.writerow(["Neutral Posts", f"{sentiment_counts.get('neutral', 0):,} ({neutral_pct:.1f}%)"])
-            writer.writerow(["Average Sentiment Score", f"{avg_sentiment_score:.3f}"])
-            writer.writerow(["Overall Sentiment", overall_sentiment])
-            writer.writerow(["", ""])
-            
-            # Reaction statistics
-            writer.writerow(["=== REACTION STATISTICS ===", ""])
-            writer.writerow(["Maximum Reactions", f"{max_reactions:,}"])
-            writer.writerow(["Minimum Reactions", f"{min_reactions:,}"])
-            writer.writerow(["Average Reactions", f"{avg_reactions:.1f}"])
-            writer.writerow(["", ""])
-            
-            # Sentiment-Reaction correlation
-            writer.writerow(["=== SENTIMENT-REACTION CORRELATION ===", ""])
-            writer.writerow(["Avg Reactions - Positive Posts", f"{avg_positive_reactions:.1f}"])
-            writer.writerow(["Avg Reactions - Negative Posts", f"{avg_negative_reactions:.1f}"])
-            writer.writerow(["Avg Reactions - Neutral Posts", f"{avg_neutral_reactions:.1f}"])
-            writer.writerow(["", ""])
-            
-            # Author statistics
-            writer.writerow(["=== AUTHOR STATISTICS ===", ""])
-            writer.writerow(["Most Active Author", f"{most_active_author[0]} ({most_active_author[1]} posts)"])
-            writer.writerow(["", ""])
-            
-            # Top authors by post count
-            writer.writerow(["=== TOP AUTHORS BY POST COUNT ===", ""])
-            writer.writerow(["Author", "Post Count", "Percentage"])
-            for author, count in author_counts.most_common(15):  # Top 15 authors
-                percentage = (count / total_posts) * 100
-                writer.writerow([author, count, f"{percentage:.1f}%"])
-            writer.writerow(["", ""])
-            
-            # Time-based analysis
-            if date_analysis:
-                writer.writerow(["=== DAILY SENTIMENT TRENDS ===", ""])
-                writer.writerow(["Date", "Positive", "Negative", "Neutral", "Total", "Sentiment Ratio"])
-                for date, stats in sorted(date_analysis.items()):
-                    sentiment_ratio = (stats['positive'] - stats['negative']) / stats['total'] if stats['total'] > 0 else 0
-                    writer.writerow([
-                        date,
-                        stats['positive'],
-                        stats['negative'],
-                        stats['neutral'],
-                        stats['total'],
-                        f"{sentiment_ratio:.3f}"
-                    ])
-                writer.writerow(["", ""])
-            
-            # Insights and recommendations
-            writer.writerow(["=== INSIGHTS & RECOMMENDATIONS ===", ""])
-            
-            # Content performance insights
-            if positive_pct > 60:
-                writer.writerow(["Content Performance", "Strong positive sentiment - continue current strategy"])
-            elif negative_pct > 40:
-                writer.writerow(["Content Performance", "High negative sentiment - review content strategy"])
-            else:
-                writer.writerow(["Content Performance", "Mixed sentiment - monitor trends and optimize"])
-            
-            # Engagement insights
-            if avg_positive_reactions > avg_negative_reactions * 1.5:
-                writer.writerow(["Engagement Pattern", "Positive content generates significantly more engagement"])
-            elif avg_negative_reactions > avg_positive_reactions * 1.5:
-                writer.writerow(["Engagement Pattern", "Negative content generates more engagement - consider balanced approach"])
-            else:
-                writer.writerow(["Engagement Pattern", "Similar engagement across sentiment types"])
+        report_rows = []
+        
+        # Header
+        report_rows.append(["LinkedIn Posts Sentiment Analysis Report", ""])
+        report_rows.append(["Generated on", report_timestamp])
+        report_rows.append(["Source File", csv_file])
+        report_rows.append(["Total Posts Analyzed", total_posts])
+        report_rows.append(["", ""])
+        
+        # Overall statistics
+        report_rows.append(["=== OVERALL STATISTICS ===", ""])
+        report_rows.append(["Total Posts", total_posts])
+        report_rows.append(["Total Reactions", f"{total_reactions:,}"])
+        report_rows.append(["Unique Authors", unique_authors])
+        report_rows.append(["Average Reactions per Post", f"{avg_reactions:.1f}"])
+        report_rows.append(["", ""])
+        
+        # Sentiment distribution
+        report_rows.append(["=== SENTIMENT DISTRIBUTION ===", ""])
+        report_rows.append(["Positive Posts", f"{sentiment_counts.get('positive', 0):,} ({positive_pct:.1f}%)"])
+        report_rows.append(["Negative Posts", f"{sentiment_counts.get('negative', 0):,} ({negative_pct:.1f}%)"])
+        report_rows.append(["Neutral Posts", f"{sentiment_counts.get('neutral', 0):,} ({neutral_pct:.1f}%)"])
+        report_rows.append(["Average Sentiment Score", f"{avg_sentiment_score:.3f}"])
+        report_rows.append(["Overall Sentiment", overall_sentiment])
+        report_rows.append(["", ""])
+        
+        # Reaction statistics
+        report_rows.append(["=== REACTION STATISTICS ===", ""])
+        report_rows.append(["Maximum Reactions", f"{max_reactions:,}"])
+        report_rows.append(["Minimum Reactions", f"{min_reactions:,}"])
+        report_rows.append(["Average Reactions", f"{avg_reactions:.1f}"])
+        report_rows.append(["", ""])
+        
+        # Sentiment-Reaction correlation
+        report_rows.append(["=== SENTIMENT-REACTION CORRELATION ===", ""])
+        report_rows.append(["Avg Reactions - Positive Posts", f"{avg_positive_reactions:.1f}"])
+        report_rows.append(["Avg Reactions - Negative Posts", f"{avg_negative_reactions:.1f}"])
+        report_rows.append(["Avg Reactions - Neutral Posts", f"{avg_neutral_reactions:.1f}"])
+        report_rows.append(["", ""])
+        
+        # Author statistics
+        report_rows.append(["=== AUTHOR STATISTICS ===", ""])
+        report_rows.append(["Most Active Author", f"{most_active_author[0]} ({most_active_author[1]} posts)"])
+        report_rows.append(["", ""])
+        
+        # Top authors by post count
+        report_rows.append(["=== TOP AUTHORS BY POST COUNT ===", ""])
+        report_rows.append(["Author", "Post Count", "Percentage"])
+        for author, count in author_counts.head(15).items():  # Top 15 authors
+            percentage = (count / total_posts) * 100
+            report_rows.append([author, count, f"{percentage:.1f}%"])
+        report_rows.append(["", ""])
+        
+        # Time-based analysis
+        if daily_counts is not None:
+            report_rows.append(["=== DAILY SENTIMENT TRENDS ===", ""])
+            report_rows.append(["Date", "Positive", "Negative", "Neutral", "Total", "Sentiment Ratio"])
+            for date, positive, negative, neutral, total in daily_counts.itertuples():
+                sentiment_ratio = (positive - negative) / total if total > 0 else 0
+                report_rows.append([
+                    date,
+                    positive,
+                    negative,
+                    neutral,
+                    total,
+                    f"{sentiment_ratio:.3f}"
+                ])
+            report_rows.append(["", ""])
+        
+        # Insights and recommendations
+        report_rows.append(["=== INSIGHTS & RECOMMENDATIONS ===", ""])
+        
+        # Content performance insights
+        if positive_pct > 60:
+            report_rows.append(["Content Performance", "Strong positive sentiment - continue current strategy"])
+        elif negative_pct > 40:
+            report_rows.append(["Content Performance", "High negative sentiment - review content strategy"])
+        else:
+            report_rows.append(["Content Performance", "Mixed sentiment - monitor trends and optimize"])
+        
+        # Engagement insights
+        if avg_positive_reactions > avg_negative_reactions * 1.5:
+            report_rows.append(["Engagement Pattern", "Positive content generates significantly more engagement"])
+        elif avg_negative_reactions > avg_positive_reactions * 1.5:
+            report_rows.append(["Engagement Pattern", "Negative content generates more engagement - consider balanced approach"])
+        else:
+            report_rows.append(["Engagement Pattern", "Similar engagement across sentiment types"])
+        
+        # Author diversity insights
+        if unique_authors < total_posts * 0.1:
+            report_rows.append(["Author Diversity", "Low author diversity - consider broadening content sources"])
+        else:
+            report_rows.append(["Author Diversity", "Good author diversity in content"])
+        
+        report_rows.append(["", ""])
+        
+        # Detailed post analysis (if requested)
+        if detailed:
+            report_rows.append(["=== DETAILED POST ANALYSIS ===", ""])
+            report_rows.append(["Post_ID", "Author", "Sentiment", "Score", "Reactions", "Content_Preview"])
             
-            # Author diversity insights
-            if unique_authors < total_posts * 0.1:
-                writer.writerow(["Author Diversity", "Low author diversity - consider broadening content sources"])
-            else:
-                writer.writerow(["Author Diversity", "Good author diversity in content"])
+            # Content previews are cut to 100 characters and kept on one line
+            contents = df['Post_Content']
+            content_previews = contents.str.slice(0, 100).str.translate(_PREVIEW_TABLE)
+            content_previews = content_previews.where(contents.str.len() <= 100, content_previews + "...")
             
-            writer.writerow(["", ""])
+            # Sort by sentiment score for detailed analysis; the stable sort keeps ties in file order
+            detailed_df = pd.DataFrame({
+                'Post_ID': df['Post_ID'],
+                'Author': df['Post_Author_Name'],
+                'Sentiment': sentiments,
+                'Score': sentiment_scores,
+                'Reactions': reactions,
+                'Content_Preview': content_previews,
+            }).sort_values('Score', ascending=False, kind='stable')
             
-            # Detailed post analysis (if requested)
-            if detailed:
-                writer.writerow(["=== DETAILED POST ANALYSIS ===", ""])
-                writer.writerow(["Post_ID", "Author", "Sentiment", "Score", "Reactions", "Content_Preview"])
-                
-                # Sort by sentiment score for detailed analysis
-                detailed_data = list(zip(post_ids, authors, sentiments, sentiment_scores, reactions, contents))
-                detailed_data.sort(key=lambda x: x[3], reverse=True)  # Sort by sentiment score
-                
-                for post_id, author, sentiment, score, reaction, content in detailed_data:
-                    content_preview = content[:100] + "..." if len(content) > 100 else content
-                    content_preview = content_preview.replace('\n', ' ').replace('\r', ' ')
-                    writer.writerow([post_id, author, sentiment, score, reaction, content_preview])
+            report_rows.extend(detailed_df.itertuples(index=False))
+        
+        with open(report_file, 'w', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
+            writer.writerows(report_rows)
         
         print(f"[*] Sentiment analysis report generated successfully: {report_file}")
-        return True
+        return total_posts
     
     except Exception as e:
         print(f"[!] Error generating report: {e}")
@@ -405,19 +534,13 @@ def main():
     
     # Generate sentiment analysis report
     print("[*] Generating sentiment analysis report...")
-    success = generate_sentiment_report(args.csv_file, args.output, args.detailed)
+    total_posts = generate_sentiment_report(args.csv_file, args.output, args.detailed)
     
-    if success:
+    if total_posts:
         print("[*] Sentiment analysis completed successfully!")
         
-        # Print summary
-        try:
-            with open(args.csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                total_posts = sum(1 for row in reader)
-                print(f"[*] Summary: Analyzed {total_posts} posts from {args.csv_file}")
-        except:
-            pass
+        # Print summary; the report already counted the posts, so the CSV isn't parsed again
+        print(f"[*] Summary: Analyzed {total_posts} posts from {args.csv_file}")
     else:
         print("[!] Failed to generate sentiment analysis report")
         sys.exit(1)